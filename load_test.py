@@ -0,0 +1,482 @@
+# Headless load test for the Radar Tracking dashboard (test.py)
+#
+# Starts the NiceGUI app (or attaches to a running one with --url) and drives N
+# concurrent simulated browser sessions over the NiceGUI socket.io event protocol.
+# Every session loads the page, mirrors the element tree from the server's
+# 'update' messages and fires the same events a browser would: typing in the
+# search box, toggling status cards and tag chips, expanding a row to add or
+# edit a comment, and exporting from the Data Management view.
+#
+# Concurrency is ramped in steps; for every step we report event round-trip
+# latency percentiles (time until the server acknowledges the processed event),
+# server CPU / memory and the step at which latency breaks down.
+#
+# Requires: python-socketio[asyncio_client], aiohttp, psutil
+#
+#   python load_test.py --steps 1,5,10,25,50 --duration 20
+#   python load_test.py --url http://127.0.0.1:8080 --latency-budget-ms 200
+#
+# Note: on NiceGUI 1.x/2.x the dashboard builds its UI on the shared auto-index
+# page, so all sessions drive one server-side client (exactly what real users
+# get there); NiceGUI 3.x script mode builds one client per page load.
+# Actions whose target element has been replaced by another session's view
+# switch are counted as "skipped" instead of failing the run.
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from typing import Dict, List, Optional
+
+import aiohttp
+import psutil
+import socketio
+
+SOCKET_PATH = '/_nicegui_ws/socket.io'
+VALUE_EVENTS = ('update:model-value', 'update:modelValue', 'update:value')
+HTML_UNESCAPES = [('&#36;', '$'), ('&#96;', '`'), ('&gt;', '>'), ('&lt;', '<'), ('&amp;', '&')]
+SEARCH_TERMS = ['radar', 'sample', 'comment', 'initial', 'person', '1', '12', 'bug']
+STATUSES = ['In Progress', 'Completed', 'On Hold']
+TAGS = ['High Priority', 'Low Priority', 'Bug', 'Feature', 'Documentation']
+
+# Relative weights of the simulated user actions
+ACTIONS = {
+    'search': 5,
+    'status_card': 3,
+    'tag_chip': 3,
+    'expand_and_comment': 2,
+    'edit_comment': 1,
+    'export': 1,
+}
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return float('nan')
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * pct / 100
+    lower = int(k)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (k - lower)
+
+
+class SimulatedSession:
+    """One headless browser tab talking to the dashboard over socket.io"""
+
+    def __init__(self, base_url: str, session_no: int, think_time: float):
+        self.base_url = base_url.rstrip('/')
+        self.session_no = session_no
+        self.think_time = think_time
+        self.client_id = None
+        self.elements: Dict[str, Dict] = {}
+        self.row_ids: List[str] = []
+        self.latencies: List[float] = []
+        self.errors = 0
+        self.skipped = 0
+        self.sio = socketio.AsyncClient(reconnection=False)
+        self.sio.on('update', self.on_update)
+
+    async def connect(self, http: aiohttp.ClientSession):
+        async with http.get(self.base_url + '/') as response:
+            response.raise_for_status()
+            html = await response.text()
+
+        client_match = re.search(r'[\'"]client_id[\'"]\s*:\s*[\'"]([^\'"]+)', html)
+        elements_match = re.search(r'parseElements\(String\.raw`(.*?)`\)', html, re.S) or \
+            re.search(r'const elements = (\{.*?\});\s*\n', html, re.S)
+        if not client_match or not elements_match:
+            raise RuntimeError('Could not find client id / element tree in page; unsupported NiceGUI version?')
+        self.client_id = client_match.group(1)
+        raw_elements = elements_match.group(1)
+        for escaped, char in HTML_UNESCAPES:
+            raw_elements = raw_elements.replace(escaped, char)
+        self.elements = {}
+        self.on_update(json.loads(raw_elements))
+
+        # NiceGUI 3.x handshakes implicitly from the connect query; older versions
+        # expect an explicit 'handshake' event (which newer ones simply refuse)
+        handshake = {
+            'client_id': self.client_id,
+            'tab_id': str(uuid.uuid4()),
+            'document_id': str(uuid.uuid4()),
+            'next_message_id': 0,
+        }
+        query = '&'.join(f'{key}={value}' for key, value in handshake.items())
+        await self.sio.connect(
+            f'{self.base_url}?{query}&implicit_handshake=true',
+            socketio_path=SOCKET_PATH,
+            transports=['websocket'],
+        )
+        await self.sio.call('handshake', handshake, timeout=10)
+
+    async def disconnect(self):
+        if self.sio.connected:
+            await self.sio.disconnect()
+
+    def on_update(self, msg: Dict):
+        # Accept both a bare element map and one wrapped in {'elements': ...}
+        updates = msg.get('elements', msg) if isinstance(msg, dict) else {}
+        for element_id, element in updates.items():
+            if str(element_id).startswith('_'):  # message metadata such as '_id'
+                continue
+            if element is None:
+                self.elements.pop(str(element_id), None)
+            else:
+                self.elements[str(element_id)] = dict(element, id=int(element_id))
+        self.refresh_row_ids()
+
+    def refresh_row_ids(self):
+        table = self.find_table()
+        if table:
+            rows = table.get('props', {}).get('rows', [])
+            self.row_ids = [row['id'] for row in rows if isinstance(row, dict) and 'id' in row]
+
+    # Element lookup in the mirrored tree
+
+    def find_listener(self, element: Dict, *event_types: str) -> Optional[str]:
+        for event in element.get('events', []):
+            if event.get('type') in event_types:
+                return event.get('listener_id')
+        return None
+
+    def find_table(self) -> Optional[Dict]:
+        for element in self.elements.values():
+            if element.get('tag', '').endswith('table') and self.find_listener(element, 'add:comment'):
+                return element
+        return None
+
+    def find_search_input(self) -> Optional[Dict]:
+        for element in self.elements.values():
+            if element.get('tag', '').endswith('input') and element.get('props', {}).get('placeholder') == 'Search...':
+                return element
+        return None
+
+    def find_button(self, text: str) -> Optional[Dict]:
+        for element in self.elements.values():
+            label = element.get('text') or element.get('props', {}).get('label')
+            if element.get('tag') == 'q-btn' and label == text and self.find_listener(element, 'click'):
+                return element
+        return None
+
+    def find_status_card(self, status: str) -> Optional[Dict]:
+        for element in self.elements.values():
+            if element.get('tag') != 'q-card' or not self.find_listener(element, 'click'):
+                continue
+            for child_id in element.get('children', []):
+                child = self.elements.get(str(child_id), {})
+                if child.get('text') == status:
+                    return element
+        return None
+
+    # Event emission
+
+    async def emit(self, element: Optional[Dict], event_type, args: List) -> None:
+        if element is None:
+            self.skipped += 1
+            return
+        event_types = event_type if isinstance(event_type, tuple) else (event_type,)
+        listener_id = self.find_listener(element, *event_types)
+        if listener_id is None:
+            self.skipped += 1
+            return
+        msg = {
+            'id': element['id'],
+            'client_id': self.client_id,
+            'listener_id': listener_id,
+            'args': [json.dumps(arg) for arg in args],
+        }
+        start = time.perf_counter()
+        try:
+            # The server acknowledges once the (synchronous) handler has run
+            await self.sio.call('event', msg, timeout=30)
+            self.latencies.append((time.perf_counter() - start) * 1000)
+        except Exception:
+            self.errors += 1
+
+    async def wait_for(self, finder, *args, timeout: float = 5.0) -> Optional[Dict]:
+        deadline = time.perf_counter() + timeout
+        while time.perf_counter() < deadline:
+            element = finder(*args)
+            if element:
+                return element
+            await asyncio.sleep(0.05)
+        return None
+
+    async def action_search(self):
+        search = self.find_search_input()
+        term = random.choice(SEARCH_TERMS)
+        # Type the query one keystroke at a time, as the browser would
+        for i in range(1, len(term) + 1):
+            await self.emit(search, VALUE_EVENTS, [term[:i]])
+            await asyncio.sleep(random.uniform(0.03, 0.12))
+        await asyncio.sleep(self.think_time)
+        await self.emit(self.find_search_input(), VALUE_EVENTS, [''])
+
+    async def action_status_card(self):
+        await self.emit(self.find_status_card(random.choice(STATUSES)), 'click', [])
+
+    async def action_tag_chip(self):
+        await self.emit(self.find_button(random.choice(TAGS)), 'click', [])
+
+    async def action_expand_and_comment(self):
+        # Expanding a row is handled purely in the browser; only the comment
+        # submitted from the expanded row reaches the server
+        if not self.row_ids:
+            self.skipped += 1
+            return
+        await asyncio.sleep(self.think_time)
+        row_id = random.choice(self.row_ids)
+        await self.emit(self.find_table(), 'add:comment', [{
+            'id': row_id,
+            'comment': f'load test comment from session {self.session_no}',
+        }])
+
+    async def action_edit_comment(self):
+        table = self.find_table()
+        if table is None or not self.row_ids:
+            self.skipped += 1
+            return
+        row_id = random.choice(self.row_ids)
+        await self.emit(table, 'edit:comment', [{
+            'radarId': row_id,
+            'commentId': f'comment-{row_id.split("//")[-1]}-1',
+            'newComment': f'edited by session {self.session_no}',
+        }])
+
+    async def action_export(self):
+        await self.emit(self.find_button('Data Management'), 'click', [])
+        export_button = await self.wait_for(self.find_button, 'Export to CSV')
+        await self.emit(export_button, 'click', [])
+        await asyncio.sleep(self.think_time)
+        await self.emit(self.find_button('Main View'), 'click', [])
+
+    async def run(self, stop_at: float):
+        names = list(ACTIONS)
+        weights = list(ACTIONS.values())
+        while time.perf_counter() < stop_at and self.sio.connected:
+            action = random.choices(names, weights)[0]
+            await getattr(self, f'action_{action}')()
+            await asyncio.sleep(random.uniform(0.5, 1.5) * self.think_time)
+
+
+class ServerMonitor:
+    """Samples CPU and RSS of the server process tree (uvicorn reloader + worker)"""
+
+    def __init__(self, pid: Optional[int], interval: float = 0.5):
+        self.interval = interval
+        self.process = psutil.Process(pid) if pid else None
+        self.cpu_samples: List[float] = []
+        self.rss_samples: List[int] = []
+        self._known: Dict[int, psutil.Process] = {}
+        self._task = None
+
+    def processes(self) -> List[psutil.Process]:
+        if self.process is None:
+            return []
+        try:
+            found = [self.process] + self.process.children(recursive=True)
+        except psutil.NoSuchProcess:
+            return []
+        # Reuse Process objects: cpu_percent() measures against the previous call on the same object
+        self._known = {p.pid: self._known.get(p.pid, p) for p in found}
+        return list(self._known.values())
+
+    async def _sample(self):
+        for proc in self.processes():
+            proc.cpu_percent(None)
+        while True:
+            await asyncio.sleep(self.interval)
+            cpu, rss = 0.0, 0
+            for proc in self.processes():
+                try:
+                    cpu += proc.cpu_percent(None)
+                    rss += proc.memory_info().rss
+                except psutil.NoSuchProcess:
+                    pass
+            self.cpu_samples.append(cpu)
+            self.rss_samples.append(rss)
+
+    def start(self):
+        self.cpu_samples, self.rss_samples = [], []
+        if self.process is not None:
+            self._task = asyncio.create_task(self._sample())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+async def run_step(base_url: str, concurrency: int, duration: float, think_time: float,
+                   monitor: ServerMonitor) -> Dict:
+    sessions = [SimulatedSession(base_url, i, think_time) for i in range(concurrency)]
+    connect_failures = 0
+    async with aiohttp.ClientSession() as http:
+        results = await asyncio.gather(*(s.connect(http) for s in sessions), return_exceptions=True)
+    connected = []
+    for session, result in zip(sessions, results):
+        if isinstance(result, Exception):
+            connect_failures += 1
+        else:
+            connected.append(session)
+
+    monitor.start()
+    started = time.perf_counter()
+    await asyncio.gather(*(s.run(started + duration) for s in connected), return_exceptions=True)
+    elapsed = time.perf_counter() - started
+    await monitor.stop()
+    await asyncio.gather(*(s.disconnect() for s in connected), return_exceptions=True)
+
+    latencies = [lat for s in connected for lat in s.latencies]
+    errors = sum(s.errors for s in connected) + connect_failures
+    events = len(latencies)
+    return {
+        'concurrency': concurrency,
+        'connected': len(connected),
+        'events': events,
+        'events_per_sec': events / elapsed if elapsed else 0.0,
+        'errors': errors,
+        'error_rate': errors / max(events + errors, 1),
+        'skipped': sum(s.skipped for s in connected),
+        'p50_ms': percentile(latencies, 50),
+        'p90_ms': percentile(latencies, 90),
+        'p95_ms': percentile(latencies, 95),
+        'p99_ms': percentile(latencies, 99),
+        'max_ms': max(latencies) if latencies else float('nan'),
+        'cpu_avg_pct': statistics.mean(monitor.cpu_samples) if monitor.cpu_samples else float('nan'),
+        'cpu_max_pct': max(monitor.cpu_samples) if monitor.cpu_samples else float('nan'),
+        'rss_max_mb': max(monitor.rss_samples) / 2 ** 20 if monitor.rss_samples else float('nan'),
+    }
+
+
+def start_server(app_path: str, port: int, workdir: str) -> subprocess.Popen:
+    # test.py reads RADAR_PORT and passes it to ui.run
+    env = dict(os.environ, PYTHONUNBUFFERED='1', RADAR_PORT=str(port))
+    return subprocess.Popen(
+        [sys.executable, os.path.abspath(app_path)],
+        cwd=workdir,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.STDOUT,
+    )
+
+
+async def wait_until_ready(base_url: str, timeout: float) -> None:
+    deadline = time.perf_counter() + timeout
+    async with aiohttp.ClientSession() as http:
+        while time.perf_counter() < deadline:
+            try:
+                async with http.get(base_url + '/') as response:
+                    if response.status == 200:
+                        return
+            except aiohttp.ClientError:
+                pass
+            await asyncio.sleep(0.5)
+    raise RuntimeError(f'Dashboard did not come up at {base_url} within {timeout:.0f}s')
+
+
+def print_report(rows: List[Dict], breakdown: Optional[Dict], budget_ms: float) -> None:
+    header = (f'{"users":>6} {"events":>7} {"ev/s":>7} {"p50":>8} {"p90":>8} {"p95":>8} '
+              f'{"p99":>8} {"max":>8} {"err%":>6} {"skip":>5} {"cpu%":>6} {"cpu max":>8} {"rss MB":>8}')
+    print()
+    print(header)
+    print('-' * len(header))
+    for r in rows:
+        print(f'{r["concurrency"]:>6} {r["events"]:>7} {r["events_per_sec"]:>7.1f} '
+              f'{r["p50_ms"]:>8.1f} {r["p90_ms"]:>8.1f} {r["p95_ms"]:>8.1f} {r["p99_ms"]:>8.1f} '
+              f'{r["max_ms"]:>8.1f} {r["error_rate"] * 100:>6.1f} {r["skipped"]:>5} '
+              f'{r["cpu_avg_pct"]:>6.1f} {r["cpu_max_pct"]:>8.1f} {r["rss_max_mb"]:>8.1f}')
+    print()
+    if breakdown:
+        print(f'Latency breaks down at {breakdown["concurrency"]} concurrent users '
+              f'(p95 {breakdown["p95_ms"]:.1f} ms, budget {budget_ms:.0f} ms, '
+              f'error rate {breakdown["error_rate"] * 100:.1f}%)')
+    else:
+        print(f'No breakdown up to {rows[-1]["concurrency"] if rows else 0} concurrent users '
+              f'(p95 budget {budget_ms:.0f} ms)')
+
+
+async def main_async(args) -> int:
+    server = None
+    workdir = None
+    pid = args.pid
+    base_url = args.url
+    if base_url is None:
+        base_url = f'http://127.0.0.1:{args.port}'
+        # Run from a scratch directory so simulated exports don't overwrite the checked-in radar_data.csv
+        workdir = tempfile.TemporaryDirectory(prefix='radar-load-test-')
+        server = start_server(args.app, args.port, workdir.name)
+        pid = server.pid
+        print(f'Started {args.app} (pid {pid}), waiting for {base_url} ...')
+
+    try:
+        await wait_until_ready(base_url, args.startup_timeout)
+        monitor = ServerMonitor(pid)
+        rows = []
+        breakdown = None
+        for concurrency in args.steps:
+            print(f'Running {concurrency} concurrent session(s) for {args.duration:.0f}s ...')
+            result = await run_step(base_url, concurrency, args.duration, args.think_time, monitor)
+            rows.append(result)
+            if breakdown is None and (result['p95_ms'] > args.latency_budget_ms
+                                      or result['error_rate'] > args.max_error_rate):
+                breakdown = result
+                if not args.keep_going:
+                    break
+        print_report(rows, breakdown, args.latency_budget_ms)
+        if args.json:
+            with open(args.json, 'w') as f:
+                json.dump({'steps': rows, 'breakdown': breakdown}, f, indent=2)
+        return 0
+    finally:
+        if server is not None:
+            for proc in reversed(ServerMonitor(server.pid).processes()):
+                try:
+                    proc.terminate()
+                except psutil.NoSuchProcess:
+                    pass
+            server.wait(timeout=10)
+        if workdir is not None:
+            workdir.cleanup()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Concurrent-client load test for the Radar Tracking dashboard')
+    parser.add_argument('--url', help='attach to an already running dashboard instead of starting one')
+    parser.add_argument('--pid', type=int, help='server pid to monitor when using --url')
+    parser.add_argument('--app', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test.py'),
+                        help='dashboard script to start (default: test.py)')
+    parser.add_argument('--port', type=int, default=8080, help='port the started dashboard listens on')
+    parser.add_argument('--steps', default='1,5,10,25,50,100',
+                        type=lambda s: [int(x) for x in s.split(',') if x.strip()],
+                        help='comma separated concurrency levels to ramp through')
+    parser.add_argument('--duration', type=float, default=20.0, help='seconds per concurrency step')
+    parser.add_argument('--think-time', type=float, default=1.0, help='mean pause between user actions (s)')
+    parser.add_argument('--latency-budget-ms', type=float, default=250.0,
+                        help='p95 round-trip latency above which the dashboard counts as broken down')
+    parser.add_argument('--max-error-rate', type=float, default=0.01,
+                        help='error rate above which the dashboard counts as broken down')
+    parser.add_argument('--keep-going', action='store_true', help='continue ramping after the breakdown point')
+    parser.add_argument('--startup-timeout', type=float, default=60.0)
+    parser.add_argument('--json', help='also write the results to this JSON file')
+    return parser.parse_args(argv)
+
+
+def main():
+    sys.exit(asyncio.run(main_async(parse_args())))
+
+
+if __name__ == '__main__':
+    main()
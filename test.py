@@ -1,10 +1,29 @@
 # 2024/12/28 Ask why row space is limited as 48px
 
-from nicegui import ui
-from typing import List, Dict
+from fastapi import Depends, HTTPException, Request
+from nicegui import Client, app, ui
+from typing import List, Dict, Optional, Tuple
+from array import array
+from collections import Counter, OrderedDict, deque
 from datetime import datetime
+import asyncio
+import bisect
+import functools
+import gc
+import heapq
+import html
+import json
+import math
+import os
 import random
+import re
+import sys
+import tracemalloc
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
 import io
 
 PROJECTS = ['Project A', 'Project B', 'Project C']
@@ -17,17 +36,494 @@ TAG_COLORS = {
     'Documentation': 'background-color: rgba(135,206,250,0.2)' # Light blue
 }
 TEAM_MEMBERS = ['Person A', 'Person B', 'Person C', 'Person D', 'Person E']
+TOKEN_PATTERN = re.compile(r'\w+')
+MIN_PREFIX_LENGTH = 2  # a shorter unfinished search term is matched exactly instead of as a prefix
+MAX_PREFIX_EXPANSIONS = 100  # an unfinished search term only matches its most common completions
+HIGHLIGHT_ROW_LIMIT = 45  # highlight only the best-ranked rows (the first pages of the table)
+
+# Columnar (Parquet / Arrow IPC) layout of a radar; tags and comments stay nested
+RADAR_SCHEMA = pa.schema([
+    ('id', pa.string()),
+    ('title', pa.string()),
+    ('dri', pa.string()),
+    ('team_dri', pa.string()),
+    ('status', pa.string()),
+    ('tags', pa.list_(pa.struct([('text', pa.string()), ('style', pa.string())]))),
+    ('comments_history', pa.list_(pa.struct([
+        ('id', pa.string()),
+        ('timestamp', pa.string()),
+        ('comment', pa.string()),
+        ('author', pa.string())
+    ])))
+])
+RADAR_FIELDS = RADAR_SCHEMA.names
+COLUMNAR_EXTENSIONS = ('.parquet', '.arrow', '.feather')
+
+# Memory diagnostics: sampling interval in seconds (0 disables) and the local log it appends to
+MEMORY_SAMPLE_INTERVAL = float(os.environ.get('RADAR_MEMORY_SAMPLE_INTERVAL', '300'))
+MEMORY_LOG = os.environ.get('RADAR_MEMORY_LOG', 'memory_diagnostics.log')
+TRACEMALLOC_FRAMES = 10
+# The /diagnostics routes are only registered with RADAR_DIAGNOSTICS=1 and only answer local requests
+DIAGNOSTICS_ENABLED = os.environ.get('RADAR_DIAGNOSTICS') == '1'
+LOOPBACK_HOSTS = {'127.0.0.1', '::1', 'localhost'}
+
+ROW_SPACING = {
+    'dense': {'height': '48px', 'input_height': '28px'},  # Better input/row ratio
+    'normal': {'height': '64px', 'input_height': '36px'},  # More comfortable input size
+    'loose': {'height': '80px', 'input_height': '44px'}  # Reduced from 96px, better scaling
+}
+
+
+def tokenize(text) -> List[str]:
+    return TOKEN_PATTERN.findall(str(text).lower())
+
+
+class SearchIndex:
+    """Incremental inverted index over radar titles and comments with BM25 ranking"""
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.postings: Dict[str, Dict[str, int]] = {}  # term -> {radar id: term frequency}
+        self.doc_fields: Dict[str, Dict[str, Counter]] = {}  # radar id -> {field key: term counts}
+        self.doc_lengths: Dict[str, int] = {}
+        self.total_length = 0
+        self.vocabulary: List[str] = []  # sorted, for prefix lookup of the term being typed
+        self.bulk_loading = False  # while set, vocabulary is left alone and sorted once afterwards
+
+    def index_row(self, row: Dict):
+        self.set_field(row['id'], 'title', row.get('title', ''))
+        comments = row.get('comments_history')
+        if isinstance(comments, list):
+            for comment in comments:
+                self.set_field(row['id'], f'comment:{comment["id"]}', comment.get('comment', ''))
+
+    def rebuild(self, rows: List[Dict]):
+        self.__init__(self.k1, self.b)
+        self.bulk_loading = True
+        for row in rows:
+            self.index_row(row)
+        self.bulk_loading = False
+        self.vocabulary = sorted(self.postings)
+
+    def set_field(self, doc_id: str, field: str, text):
+        """Index (or re-index) one text field of a radar, e.g. its title or a single comment"""
+        fields = self.doc_fields.setdefault(doc_id, {})
+        old_counts = fields.pop(field, None)
+        if old_counts:
+            self._remove_counts(doc_id, old_counts)
+
+        counts = Counter(tokenize(text))
+        fields[field] = counts
+        for term, tf in counts.items():
+            docs = self.postings.get(term)
+            if docs is None:
+                docs = self.postings[term] = {}
+                if not self.bulk_loading:
+                    bisect.insort(self.vocabulary, term)
+            docs[doc_id] = docs.get(doc_id, 0) + tf
+        length = sum(counts.values())
+        self.doc_lengths[doc_id] = self.doc_lengths.get(doc_id, 0) + length
+        self.total_length += length
+
+    def remove_doc(self, doc_id: str):
+        for counts in self.doc_fields.pop(doc_id, {}).values():
+            self._remove_counts(doc_id, counts)
+        self.doc_lengths.pop(doc_id, None)
+
+    def _remove_counts(self, doc_id: str, counts: Counter):
+        for term, tf in counts.items():
+            docs = self.postings[term]
+            remaining = docs[doc_id] - tf
+            if remaining > 0:
+                docs[doc_id] = remaining
+            else:
+                del docs[doc_id]
+                if not docs:
+                    del self.postings[term]
+                    if not self.bulk_loading:
+                        del self.vocabulary[bisect.bisect_left(self.vocabulary, term)]
+        length = sum(counts.values())
+        self.doc_lengths[doc_id] -= length
+        self.total_length -= length
+
+    def expand_prefix(self, prefix: str) -> List[str]:
+        start = bisect.bisect_left(self.vocabulary, prefix)
+        end = bisect.bisect_left(self.vocabulary, prefix + chr(sys.maxunicode), start)
+        terms = self.vocabulary[start:end]
+        if len(terms) > MAX_PREFIX_EXPANSIONS:
+            terms = heapq.nlargest(MAX_PREFIX_EXPANSIONS, terms, key=lambda t: len(self.postings[t]))
+        return terms
+
+    def query_terms(self, query: str) -> Tuple[List[str], Optional[str]]:
+        """Split a query into exact terms and the (possibly unfinished) last term used as prefix"""
+        terms = tokenize(query)
+        if terms and not query[-1:].isspace() and len(terms[-1]) >= MIN_PREFIX_LENGTH:
+            return terms[:-1], terms[-1]
+        return terms, None
+
+    def search(self, query: str) -> List[Tuple[str, float]]:
+        """Return (radar id, score) pairs of radars matching every query term, best first"""
+        exact, prefix = self.query_terms(query)
+        groups = [[term] for term in dict.fromkeys(exact)]
+        if prefix is not None:
+            groups.append(self.expand_prefix(prefix))
+        if not groups or not self.doc_lengths:
+            return []
+
+        n_docs = len(self.doc_lengths)
+        avg_length = self.total_length / n_docs or 1.0
+        group_postings = [[(self.postings[t], self.idf(len(self.postings[t]), n_docs)) for t in group
+                           if t in self.postings] for group in groups]
+        if not all(group_postings):
+            return []
+
+        # Start with the rarest group so the candidate set stays small
+        group_postings.sort(key=lambda g: sum(len(docs) for docs, _ in g))
+        scores: Dict[str, float] = {}
+        for i, group in enumerate(group_postings):
+            group_scores: Dict[str, float] = {}
+            for docs, idf in group:
+                if i == 0:
+                    candidates = docs
+                elif len(docs) <= len(scores):
+                    candidates = [d for d in docs if d in scores]
+                else:
+                    candidates = [d for d in scores if d in docs]
+                for doc_id in candidates:
+                    tf = docs[doc_id]
+                    norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[doc_id] / avg_length)
+                    group_scores[doc_id] = group_scores.get(doc_id, 0.0) + idf * tf * (self.k1 + 1) / (tf + norm)
+            if i == 0:
+                scores = group_scores
+            else:
+                scores = {doc_id: scores[doc_id] + s for doc_id, s in group_scores.items()}
+            if not scores:
+                return []
+        return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+    @staticmethod
+    def idf(doc_freq: int, n_docs: int) -> float:
+        return math.log(1 + (n_docs - doc_freq + 0.5) / (doc_freq + 0.5))
+
+    def highlight(self, text, query: str, width: Optional[int] = None) -> Optional[str]:
+        """HTML-escaped text with matching terms wrapped in <mark>, or None if nothing matches.
+        With a width, the text is cropped to a snippet around the first match."""
+        exact, prefix = self.query_terms(query)
+        exact = set(exact)
+        text = str(text)
+        spans = [m.span() for m in TOKEN_PATTERN.finditer(text)
+                 if m.group().lower() in exact or (prefix is not None and m.group().lower().startswith(prefix))]
+        if not spans:
+            return None
+
+        start, end = 0, len(text)
+        if width is not None and len(text) > width:
+            start = max(0, spans[0][0] - width // 4)
+            end = min(len(text), start + width)
+        parts = ['…' if start > 0 else '']
+        pos = start
+        for span_start, span_end in spans:
+            if span_start < start or span_end > end:
+                continue
+            parts.append(html.escape(text[pos:span_start]))
+            parts.append(f'<mark>{html.escape(text[span_start:span_end])}</mark>')
+            pos = span_end
+        parts.append(html.escape(text[pos:end]))
+        parts.append('…' if end < len(text) else '')
+        return ''.join(parts)
+
+    def highlight_row(self, row: Dict, query: str) -> Dict:
+        """Highlighted title and the snippet of the first matching comment for the table body"""
+        snippet = None
+        comments = row.get('comments_history')
+        if isinstance(comments, list):
+            for comment in comments:
+                snippet = self.highlight(comment.get('comment', ''), query, width=80)
+                if snippet:
+                    break
+        return {'title': self.highlight(row.get('title', ''), query), 'snippet': snippet}
+
+# Table slot templates. They are plain strings built once per process and shipped to each
+# client once as <script type="text/x-template"> blocks in the page head; the table slots only
+# reference them by id. Row spacing comes in through CSS variables on the table wrapper and
+# the team options through the team_dri column, so neither requires re-sending a template.
+SLOT_TEMPLATES = {
+    'radar-table-header': '''
+<q-tr>
+    <q-th style="width: 50px; padding: 0px 4px"></q-th>
+    <q-th v-for="col in props.cols" :key="col.name"
+         :class="col.headerClass"
+         style="padding: 2px 16px 2px 4px; text-align: left">
+        {{ col.label }}
+    </q-th>
+</q-tr>
+''',
+    'radar-table-body': '''
+<q-tr :props="props" class="text-xs hover:bg-gray-50" style="height: var(--radar-row-height)">
+    <!-- Expand button cell -->
+    <q-td style="width: 50px; padding: 0px 4px; text-align: center">
+        <q-btn size="xs" color="blue" round dense flat
+            @click="props.expand = !props.expand"
+            :icon="props.expand ? 'remove' : 'add'" />
+    </q-td>
+
+    <!-- Data cells -->
+    <q-td v-for="col in props.cols" :key="col.name" :props="props" 
+          style="padding: 2px 16px 2px 4px">
+        <template v-if="col.name === 'id'">
+             <a :href="col.value" 
+                class="text-blue-600 hover:text-blue-800 hover:underline">
+                 {{ col.value }}
+             </a>
+        </template>
+        <template v-else-if="col.name === 'title' && props.row.search_highlights && props.row.search_highlights.title">
+            <span v-html="props.row.search_highlights.title"></span>
+        </template>
+        <template v-else-if="col.name === 'tags'">
+            <div class="flex gap-0.5">
+                <span v-for="tag in col.value" 
+                    :key="tag.text" 
+                    class="px-1 rounded text-xs"
+                    :style="tag.style">
+                    {{tag.text}}
+                </span>
+            </div>
+        </template>
+        <template v-else-if="col.name === 'team_dri'">
+            <q-select
+                v-model="props.row.team_dri"
+                :options="col.options"
+                dense
+                borderless
+                class="text-xs"
+                style="padding: 0; margin: 0; min-height: var(--radar-input-height);"
+                @update:model-value="$parent.$emit('update:team_dri', 
+                                 { id: props.row.id, value: $event })"
+            />
+        </template>
+        <template v-else-if="col.name === 'comments'">
+            <div class="text-xs text-gray-500">
+                {{ props.row.comments_history ? props.row.comments_history.length : 0 }} comment(s)
+            </div>
+            <div v-if="props.row.search_highlights && props.row.search_highlights.snippet"
+                 class="text-xs text-gray-700"
+                 v-html="props.row.search_highlights.snippet">
+            </div>
+        </template>
+        <template v-else-if="col.name === 'actions'">
+            <q-btn size="xs" color="red" round dense flat icon="delete" class="delete-btn"
+                   @click="$q.dialog({
+                       title: 'Confirm Deletion',
+                       message: 'Are you sure you want to delete this radar?',
+                       ok: { label: 'Yes', color: 'negative' },
+                       cancel: { label: 'Cancel' }
+                   }).onOk(() => {
+                       $parent.$emit('row:delete', props.row.id)
+                   })" />
+        </template>
+        <template v-else>
+            {{ col.value }}
+        </template>
+    </q-td>
+</q-tr>
+<q-tr v-show="props.expand" :props="props">
+    <q-td style="width: 50px"></q-td>
+    <q-td colspan="100%">
+        <div class="text-left p-4 bg-gray-50">
+            <!-- Summary Section -->
+            <div class="mb-4">
+                <div class="text-sm font-bold mb-2">Summary</div>
+                <div class="text-xs text-gray-500 italic">TBD - This section will be implemented in future updates.</div>
+            </div>
+
+            <!-- Comments Section -->
+            <div>
+                <div class="text-sm font-bold mb-2">Comments</div>
+
+                <!-- Add new comment section -->
+                <div class="mb-4">
+                    <q-input
+                        v-model="props.row.newComment"
+                        type="textarea"
+                        dense
+                        outlined
+                        placeholder="Add a new comment..."
+                        class="text-xs bg-white mb-2"
+                        style="min-height: 60px"
+                    />
+                    <q-btn 
+                        color="primary" 
+                        dense 
+                        size="sm"
+                        :disable="!props.row.newComment"
+                        @click="$parent.$emit('add:comment', { 
+                            id: props.row.id, 
+                            comment: props.row.newComment 
+                        })"
+                    >
+                        Add Comment
+                    </q-btn>
+                </div>
+
+                <!-- Comments list -->
+                <div class="space-y-2">
+                    <div v-for="(comment, index) in props.row.comments_history" 
+                        :key="comment.id" 
+                        class="bg-white p-3 rounded border"
+                    >
+                        <div class="flex justify-between items-start mb-1">
+                            <div class="text-xs text-gray-500">
+                                {{ comment.timestamp }} by {{ comment.author }}
+                            </div>
+                            <div class="flex gap-1">
+                                <q-btn 
+                                    v-if="!comment.editing"
+                                    flat 
+                                    dense 
+                                    round 
+                                    icon="edit" 
+                                    size="xs"
+                                    @click="comment.editing = true; comment.editText = comment.comment"
+                                />
+                                <template v-else>
+                                    <q-btn 
+                                        flat 
+                                        dense 
+                                        round 
+                                        icon="check" 
+                                        size="xs"
+                                        color="positive"
+                                        @click="$parent.$emit('edit:comment', { 
+                                            radarId: props.row.id, 
+                                            commentId: comment.id,
+                                            newComment: comment.editText 
+                                        })"
+                                    />
+                                    <q-btn 
+                                        flat 
+                                        dense 
+                                        round 
+                                        icon="close" 
+                                        size="xs"
+                                        color="negative"
+                                        @click="comment.editing = false"
+                                    />
+                                </template>
+                            </div>
+                        </div>
+                        <div v-if="!comment.editing" class="text-sm whitespace-pre-wrap">
+                            {{ comment.comment }}
+                        </div>
+                        <q-input
+                            v-else
+                            v-model="comment.editText"
+                            type="textarea"
+                            dense
+                            outlined
+                            autogrow
+                            class="text-sm"
+                        />
+                    </div>
+                </div>
+            </div>
+        </div>
+    </q-td>
+</q-tr>
+''',
+}
+
+
+@functools.lru_cache(maxsize=None)
+def slot_templates_head_html() -> str:
+    return ''.join(f'<script type="text/x-template" id="{name}">{template}</script>\n'
+                   for name, template in SLOT_TEMPLATES.items())
+
+
+def slot_template_ref(name: str) -> str:
+    # Vue resolves a template starting with '#' from the DOM element with that id
+    assert name in SLOT_TEMPLATES, name
+    return f'#{name}'
+
+
+def normalize_query(text: str) -> str:
+    # Collapse whitespace but keep a single trailing space: it marks the last term as complete
+    return re.sub(r'\s+', ' ', (text or '').lower()).lstrip()
+
+
+class ResultCache:
+    """Size-bounded LRU cache of filter/search results, stored as arrays of row positions in data"""
+
+    def __init__(self, max_entries: int = 256, max_rows: int = 2_000_000):
+        self.max_entries = max_entries
+        self.max_rows = max_rows  # bound on the total number of row positions held
+        self.entries: OrderedDict = OrderedDict()
+        self.version = None
+        self.total_rows = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Tuple, version: int) -> Optional[array]:
+        if version != self.version:
+            self.clear()
+            self.version = version
+        indices = self.entries.get(key)
+        if indices is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return indices
+
+    def put(self, key: Tuple, version: int, indices: array):
+        if version != self.version or len(indices) > self.max_rows:
+            return
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.total_rows -= len(old)
+        self.entries[key] = indices
+        self.total_rows += len(indices)
+        while len(self.entries) > self.max_entries or self.total_rows > self.max_rows:
+            _, evicted = self.entries.popitem(last=False)
+            self.total_rows -= len(evicted)
+            self.evictions += 1
+
+    def clear(self):
+        self.entries.clear()
+        self.total_rows = 0
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'entries': len(self.entries),
+            'rows': self.total_rows,
+            'bytes': sum(indices.itemsize * len(indices) for indices in self.entries.values()),
+        }
+
 
 class RadarTracker:
     def __init__(self):
         self.data = self.generate_sample_data()
         self.filtered_data = self.data.copy()
+        self.search_index = SearchIndex()
+        self.search_index.rebuild(self.data)
+        self.data_version = 0  # bumped on every change to self.data, invalidates result_cache
+        self.result_cache = ResultCache()
+
+        # Let the memory diagnostics find this tracker through its client
+        ui.context.client.radar_tracker = self
         self.selected_project = PROJECTS[0]
         self.status_filter = None
         self.tag_filter = None
         self.search_query = ""
         self.current_view = 'main'
         self.container = None
+        self.export_columns = list(RADAR_FIELDS)
 
         # Initialize row spacing
         self.row_spacing = 'dense'  # default value
@@ -36,7 +532,8 @@ class RadarTracker:
             {'name': 'id', 'label': 'Radar ID', 'field': 'id', 'align': 'left', 'sortable': True},
             {'name': 'title', 'label': 'Title', 'field': 'title', 'align': 'left', 'sortable': True},
             {'name': 'dri', 'label': 'Current DRI', 'field': 'dri', 'align': 'left', 'sortable': True},
-            {'name': 'team_dri', 'label': 'Team DRI', 'field': 'team_dri', 'align': 'left', 'sortable': True},
+            {'name': 'team_dri', 'label': 'Team DRI', 'field': 'team_dri', 'align': 'left', 'sortable': True,
+             'options': TEAM_MEMBERS},
             {'name': 'status', 'label': 'Status', 'field': 'status', 'align': 'left', 'sortable': True},
             {'name': 'tags', 'label': 'Tags', 'field': 'tags', 'align': 'left'},
             {'name': 'comments', 'label': 'Comments', 'field': 'comments', 'align': 'left'}
@@ -56,8 +553,15 @@ class RadarTracker:
                     resize: vertical !important;
                     overflow: auto !important;
                 }
+                /* Search match highlights */
+                .q-table mark {
+                    background-color: rgba(255,215,0,0.5);
+                    padding: 0 1px;
+                    border-radius: 2px;
+                }
             </style>
         ''')
+        ui.add_head_html(slot_templates_head_html())
 
         self.setup_ui()
 
@@ -199,6 +703,12 @@ class RadarTracker:
                 # Add refresh button
                 ui.button(icon='refresh', on_click=lambda: self.refresh_stats()).props('flat')
 
+                cache_stats = self.result_cache.stats()
+                ui.label(
+                    f'Filter cache: {cache_stats["hits"]} hits / {cache_stats["misses"]} misses '
+                    f'({cache_stats["hit_rate"]:.0%} hit rate), {cache_stats["entries"]} cached result sets'
+                ).classes('text-xs text-gray-500')
+
             # Status Distribution with drill-down capability
             with ui.card().classes('w-full my-4 p-4'):
                 ui.label('Status Distribution').classes('text-lg font-bold mb-4')
@@ -287,6 +797,10 @@ class RadarTracker:
 
             ui.button('Close', on_click=dialog.close).props('flat')
 
+        # Wait until the dialog is closed, then drop it instead of leaking one dialog per click
+        await dialog
+        dialog.delete()
+
     def refresh_stats(self):
         """Refresh all statistics and charts"""
         self.update_view()
@@ -301,13 +815,27 @@ class RadarTracker:
                         ui.label('Export Data').classes('text-sm font-bold')
                         ui.button('Export to CSV', on_click=self.export_data).classes('my-2')
 
+                        # Column projection for the columnar formats
+                        ui.select(
+                            RADAR_FIELDS,
+                            multiple=True,
+                            value=self.export_columns,
+                            label='Columns',
+                            on_change=lambda e: setattr(self, 'export_columns', list(e.value))
+                        ).props('use-chips dense').classes('w-full text-sm')
+                        with ui.row().classes('gap-2'):
+                            ui.button('Export to Parquet',
+                                      on_click=lambda: self.export_columnar('parquet')).classes('my-2')
+                            ui.button('Export to Arrow',
+                                      on_click=lambda: self.export_columnar('arrow')).classes('my-2')
+
                     with ui.column().classes('w-1/2'):
                         ui.label('Import Data').classes('text-sm font-bold')
                         ui.upload(
-                            label='Upload CSV',
+                            label='Upload CSV / Parquet / Arrow',
                             on_upload=self.import_data,
                             auto_upload=True
-                        ).props('accept=.csv').classes('my-2')
+                        ).props('accept=.csv,.parquet,.arrow,.feather').classes('my-2')
 
     def setup_stats_cards(self):
         status_counts = {status: len([r for r in self.data if r['status'] == status])
@@ -369,15 +897,11 @@ class RadarTracker:
         column['headerClasses'] = '' if visible else 'hidden'
         self.table.update()
 
-    def create_table(self):
-        spacing_config = {
-            'dense': {'height': '48px', 'input_height': '28px'},
-            'normal': {'height': '64px', 'input_height': '36px'},
-            'loose': {'height': '80px', 'input_height': '44px'}
-        }
-
-        current_config = spacing_config.get(getattr(self, 'row_spacing', 'dense'))
+    def row_spacing_style(self) -> str:
+        config = ROW_SPACING.get(getattr(self, 'row_spacing', 'dense'), ROW_SPACING['dense'])
+        return f'--radar-row-height: {config["height"]}; --radar-input-height: {config["input_height"]}'
 
+    def create_table(self):
         # Add a column for delete button
         columns_with_delete = self.columns.copy()
         columns_with_delete.append({
@@ -387,28 +911,17 @@ class RadarTracker:
             'align': 'center'
         })
 
-        self.table = ui.table(
-            columns=columns_with_delete,
-            rows=self.filtered_data,
-            row_key='id',
-            pagination={'rowsPerPage': 15}
-        ).classes('w-full')
-
-        self.table.add_slot('header', '''
-            <q-tr>
-                <q-th style="width: 50px; padding: 0px 4px"></q-th>
-                <q-th v-for="col in props.cols" :key="col.name" 
-                     :class="col.headerClass"
-                     style="padding: 2px 16px 2px 4px; text-align: left">
-                    {{ col.label }}
-                </q-th>
-            </q-tr>
-        ''')
+        # The wrapper carries the row spacing CSS variables, so changing them doesn't re-send the table
+        with ui.element('div').classes('w-full').style(self.row_spacing_style()) as self.table_wrapper:
+            self.table = ui.table(
+                columns=columns_with_delete,
+                rows=self.get_table_rows(),
+                row_key='id',
+                pagination={'rowsPerPage': 15}
+            ).classes('w-full')
 
-        self.table.add_slot('body', self.get_table_body_template(
-            current_config['height'],
-            current_config['input_height']
-        ))
+        self.table.add_slot('header', slot_template_ref('radar-table-header'))
+        self.table.add_slot('body', slot_template_ref('radar-table-body'))
 
         # Update event handlers
         self.table.on('update:team_dri', self.update_team_dri)
@@ -432,198 +945,22 @@ class RadarTracker:
                 })
                 break
 
+        self.data_version += 1
         self.apply_filters()
 
     def delete_row(self, row_id):
         self.data = [row for row in self.data if row['id'] != row_id.args]
+        self.search_index.remove_doc(row_id.args)
+        self.data_version += 1
         self.filtered_data = [row for row in self.filtered_data if row['id'] != row_id.args]
         self.update_table()
         self.update_view()
         ui.notify(f'Radar {row_id.args} has been removed')
 
     def change_row_spacing(self, e):
-        if hasattr(self, 'table'):
-            self.row_spacing = e.value
-            spacing_config = {
-                'dense': {'height': '48px', 'input_height': '28px'},  # Better input/row ratio
-                'normal': {'height': '64px', 'input_height': '36px'},  # More comfortable input size
-                'loose': {'height': '80px', 'input_height': '44px'}  # Reduced from 96px, better scaling
-            }
-            current_config = spacing_config[e.value]
-
-            # Update the existing table's body slot
-            self.table.add_slot('body', self.get_table_body_template(
-                current_config['height'],
-                current_config['input_height']
-            ))
-            self.table.update()
-
-    def get_table_body_template(self, row_height, input_height):
-        return f'''
-               <q-tr :props="props" class="text-xs hover:bg-gray-50" style="height: {row_height}">
-                   <!-- Expand button cell -->
-                   <q-td style="width: 50px; padding: 0px 4px; text-align: center">
-                       <q-btn size="xs" color="blue" round dense flat
-                           @click="props.expand = !props.expand"
-                           :icon="props.expand ? 'remove' : 'add'" />
-                   </q-td>
-
-                   <!-- Data cells -->
-                   <q-td v-for="col in props.cols" :key="col.name" :props="props" 
-                         style="padding: 2px 16px 2px 4px">
-                       <template v-if="col.name === 'id'">
-                            <a :href="col.value" 
-                               class="text-blue-600 hover:text-blue-800 hover:underline">
-                                {{{{ col.value }}}}
-                            </a>
-                       </template>
-                       <template v-else-if="col.name === 'tags'">
-                           <div class="flex gap-0.5">
-                               <span v-for="tag in col.value" 
-                                   :key="tag.text" 
-                                   class="px-1 rounded text-xs"
-                                   :style="tag.style">
-                                   {{{{tag.text}}}}
-                               </span>
-                           </div>
-                       </template>
-                       <template v-else-if="col.name === 'team_dri'">
-                           <q-select
-                               v-model="props.row.team_dri"
-                               :options="['Person A', 'Person B', 'Person C', 'Person D', 'Person E']"
-                               dense
-                               borderless
-                               class="text-xs"
-                               style="padding: 0; margin: 0; min-height: {input_height};"
-                               @update:model-value="$parent.$emit('update:team_dri', 
-                                                {{ id: props.row.id, value: $event }})"
-                           />
-                       </template>
-                       <template v-else-if="col.name === 'comments'">
-                           <div class="text-xs text-gray-500">
-                               {{{{ props.row.comments_history ? props.row.comments_history.length : 0 }}}} comment(s)
-                           </div>
-                       </template>
-                       <template v-else-if="col.name === 'actions'">
-                           <q-btn size="xs" color="red" round dense flat icon="delete" class="delete-btn"
-                                  @click="$q.dialog({{
-                                      title: 'Confirm Deletion',
-                                      message: 'Are you sure you want to delete this radar?',
-                                      ok: {{ label: 'Yes', color: 'negative' }},
-                                      cancel: {{ label: 'Cancel' }}
-                                  }}).onOk(() => {{
-                                      $parent.$emit('row:delete', props.row.id)
-                                  }})" />
-                       </template>
-                       <template v-else>
-                           {{{{ col.value }}}}
-                       </template>
-                   </q-td>
-               </q-tr>
-               <q-tr v-show="props.expand" :props="props">
-                   <q-td style="width: 50px"></q-td>
-                   <q-td colspan="100%">
-                       <div class="text-left p-4 bg-gray-50">
-                           <!-- Summary Section -->
-                           <div class="mb-4">
-                               <div class="text-sm font-bold mb-2">Summary</div>
-                               <div class="text-xs text-gray-500 italic">TBD - This section will be implemented in future updates.</div>
-                           </div>
-
-                           <!-- Comments Section -->
-                           <div>
-                               <div class="text-sm font-bold mb-2">Comments</div>
-
-                               <!-- Add new comment section -->
-                               <div class="mb-4">
-                                   <q-input
-                                       v-model="props.row.newComment"
-                                       type="textarea"
-                                       dense
-                                       outlined
-                                       placeholder="Add a new comment..."
-                                       class="text-xs bg-white mb-2"
-                                       style="min-height: 60px"
-                                   />
-                                   <q-btn 
-                                       color="primary" 
-                                       dense 
-                                       size="sm"
-                                       :disable="!props.row.newComment"
-                                       @click="$parent.$emit('add:comment', {{ 
-                                           id: props.row.id, 
-                                           comment: props.row.newComment 
-                                       }})"
-                                   >
-                                       Add Comment
-                                   </q-btn>
-                               </div>
-
-                               <!-- Comments list -->
-                               <div class="space-y-2">
-                                   <div v-for="(comment, index) in props.row.comments_history" 
-                                       :key="comment.id" 
-                                       class="bg-white p-3 rounded border"
-                                   >
-                                       <div class="flex justify-between items-start mb-1">
-                                           <div class="text-xs text-gray-500">
-                                               {{{{ comment.timestamp }}}} by {{{{ comment.author }}}}
-                                           </div>
-                                           <div class="flex gap-1">
-                                               <q-btn 
-                                                   v-if="!comment.editing"
-                                                   flat 
-                                                   dense 
-                                                   round 
-                                                   icon="edit" 
-                                                   size="xs"
-                                                   @click="comment.editing = true; comment.editText = comment.comment"
-                                               />
-                                               <template v-else>
-                                                   <q-btn 
-                                                       flat 
-                                                       dense 
-                                                       round 
-                                                       icon="check" 
-                                                       size="xs"
-                                                       color="positive"
-                                                       @click="$parent.$emit('edit:comment', {{ 
-                                                           radarId: props.row.id, 
-                                                           commentId: comment.id,
-                                                           newComment: comment.editText 
-                                                       }})"
-                                                   />
-                                                   <q-btn 
-                                                       flat 
-                                                       dense 
-                                                       round 
-                                                       icon="close" 
-                                                       size="xs"
-                                                       color="negative"
-                                                       @click="comment.editing = false"
-                                                   />
-                                               </template>
-                                           </div>
-                                       </div>
-                                       <div v-if="!comment.editing" class="text-sm whitespace-pre-wrap">
-                                           {{{{ comment.comment }}}}
-                                       </div>
-                                       <q-input
-                                           v-else
-                                           v-model="comment.editText"
-                                           type="textarea"
-                                           dense
-                                           outlined
-                                           autogrow
-                                           class="text-sm"
-                                       />
-                                   </div>
-                               </div>
-                           </div>
-                       </div>
-                   </q-td>
-               </q-tr>
-           '''
+        self.row_spacing = e.value
+        if hasattr(self, 'table_wrapper'):
+            self.table_wrapper.style(self.row_spacing_style())
 
     def add_comment(self, e):
         row_id = e.args['id']
@@ -639,6 +976,8 @@ class RadarTracker:
                 }
                 row['comments_history'].append(new_comment)
                 row['newComment'] = ''  # Clear the input field
+                self.search_index.set_field(row_id, f'comment:{new_comment["id"]}', comment_text)
+                self.data_version += 1
                 break
 
         self.update_table()
@@ -655,6 +994,8 @@ class RadarTracker:
                     if comment['id'] == comment_id:
                         comment['comment'] = new_comment
                         comment['editing'] = False
+                        self.search_index.set_field(radar_id, f'comment:{comment_id}', new_comment)
+                        self.data_version += 1
                         break
                 break
 
@@ -662,7 +1003,7 @@ class RadarTracker:
         ui.notify('Comment updated successfully')
 
     def handle_search(self, e):
-        self.search_query = e.value.lower()
+        self.search_query = normalize_query(e.value)
         self.apply_filters()
 
     def handle_filter(self, value: str, is_status: bool):
@@ -673,24 +1014,35 @@ class RadarTracker:
         self.apply_filters()
 
     def apply_filters(self):
-        self.filtered_data = self.data.copy()
+        key = (self.search_query, self.status_filter, self.tag_filter, self.selected_project)
+        indices = self.result_cache.get(key, self.data_version)
+        if indices is None:
+            indices = array('I', self.filter_indices())
+            self.result_cache.put(key, self.data_version, indices)
 
-        if self.search_query:
-            self.filtered_data = [
-                row for row in self.filtered_data
-                if any(str(value).lower().find(self.search_query) != -1
-                       for value in row.values() if isinstance(value, (str, int, float)))
-            ]
-
-        if self.status_filter:
-            self.filtered_data = [row for row in self.filtered_data
-                                  if row['status'] == self.status_filter]
+        self.filtered_data = [self.data[i] for i in indices]
+        self.update_table()
 
-        if self.tag_filter:
-            self.filtered_data = [row for row in self.filtered_data
-                                  if any(tag['text'] == self.tag_filter for tag in row['tags'])]
+    def filter_indices(self) -> List[int]:
+        """Positions in self.data of the rows matching the current search and filters"""
+        scores = dict(self.search_index.search(self.search_query)) if self.search_query else {}
+        indices = []
+        for i, row in enumerate(self.data):
+            if self.status_filter and row['status'] != self.status_filter:
+                continue
+            if self.tag_filter and not any(tag['text'] == self.tag_filter for tag in row['tags']):
+                continue
+            # Full-text matches over titles and comments, or a match on a scalar field (id, DRI, status, ...)
+            if self.search_query and row['id'] not in scores and not any(
+                    str(value).lower().find(self.search_query) != -1
+                    for value in row.values() if isinstance(value, (str, int, float))):
+                continue
+            indices.append(i)
 
-        self.update_table()
+        if self.search_query:
+            # Full-text hits first, ranked by BM25
+            indices.sort(key=lambda i: scores.get(self.data[i]['id'], 0.0), reverse=True)
+        return indices
 
     def update_comment(self, e):
         row_id = e.args['id']
@@ -714,9 +1066,18 @@ class RadarTracker:
         self.selected_project = project
         ui.notify(f'Switched to {project}')
 
+    def get_table_rows(self) -> List[Dict]:
+        if not self.search_query:
+            return self.filtered_data.copy()
+        # Attach highlights to shallow copies so they never leak into self.data or exports;
+        # rows are ranked best first, so only the leading ones are worth the regex pass
+        rows = [dict(row, search_highlights=self.search_index.highlight_row(row, self.search_query))
+                for row in self.filtered_data[:HIGHLIGHT_ROW_LIMIT]]
+        return rows + self.filtered_data[HIGHLIGHT_ROW_LIMIT:]
+
     def update_table(self):
         if hasattr(self, 'table'):
-            self.table.rows = self.filtered_data.copy()
+            self.table.rows = self.get_table_rows()
             self.table.update()
 
     def export_data(self):
@@ -735,8 +1096,102 @@ class RadarTracker:
         # Download file
         ui.download('radar_data.csv')
 
-    def import_data(self, e):
-        content = e.content.read().decode('utf-8')
+    def to_arrow(self, rows: List[Dict], columns: List[str]) -> pa.Table:
+        """Build an Arrow table holding only the requested columns of the given rows"""
+        arrays = []
+        for name in columns:
+            if name == 'tags':
+                values = [[{'text': tag.get('text'),
+                            'style': tag.get('style', TAG_COLORS.get(tag.get('text')))}
+                           for tag in row.get('tags') or []]
+                          for row in rows]
+            elif name == 'comments_history':
+                values = [[{'id': comment.get('id'),
+                            'timestamp': comment.get('timestamp'),
+                            'comment': comment.get('comment'),
+                            'author': comment.get('author')}
+                           for comment in row.get('comments_history') or []]
+                          if isinstance(row.get('comments_history'), list) else []
+                          for row in rows]
+            else:
+                values = [None if row.get(name) is None else str(row.get(name)) for row in rows]
+            arrays.append(pa.array(values, type=RADAR_SCHEMA.field(name).type))
+        return pa.Table.from_arrays(arrays, schema=pa.schema([RADAR_SCHEMA.field(name) for name in columns]))
+
+    def export_columnar(self, fmt: str):
+        columns = [name for name in RADAR_FIELDS if name in self.export_columns]
+        if not columns:
+            ui.notify('Select at least one column to export', type='warning')
+            return
+        table = self.to_arrow(self.filtered_data, columns)
+
+        # Build the file in memory so concurrent exports from different clients can't mix up files
+        sink = pa.BufferOutputStream()
+        if fmt == 'parquet':
+            filename = 'radar_data.parquet'
+            pq.write_table(table, sink, compression='zstd')
+        else:
+            filename = 'radar_data.arrow'
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+        ui.download.content(sink.getvalue().to_pybytes(), filename)
+
+    def import_columnar(self, name: str, content: bytes):
+        # Read straight from the uploaded bytes, only the columns we know about
+        source = pa.BufferReader(pa.py_buffer(content))
+        try:
+            if name.endswith('.parquet'):
+                available = pq.read_schema(source).names
+                source.seek(0)
+                table = pq.read_table(source, columns=[c for c in RADAR_FIELDS if c in available])
+            else:
+                try:
+                    available = pa.ipc.open_file(source).schema.names
+                except pa.ArrowInvalid:
+                    available = None  # Feather V1 has no IPC footer to take the schema from, so it is read whole
+                source.seek(0)
+                columns = None if available is None else [c for c in RADAR_FIELDS if c in available]
+                table = feather.read_table(source, columns=columns)
+                table = table.select([c for c in RADAR_FIELDS if c in table.column_names])
+            # Reject files whose columns don't fit RADAR_SCHEMA (e.g. tags flattened to strings)
+            table = table.cast(pa.schema([RADAR_SCHEMA.field(c) for c in table.column_names]))
+        except pa.ArrowException as ex:
+            ui.notify(f'Could not import {name}: {ex}', type='negative')
+            return
+
+        if 'id' not in table.column_names:
+            ui.notify('Imported file has no id column', type='negative')
+            return
+        missing_ids = table.column('id').null_count
+        if missing_ids:
+            table = table.filter(pc.is_valid(table.column('id')))
+            ui.notify(f'Skipped {missing_ids} rows without an id', type='warning')
+
+        # The app works on row dicts, so the columns are materialized into Python objects here
+        columns = {name: table.column(name).to_pylist() for name in table.column_names}
+        imported_data = []
+        for i in range(table.num_rows):
+            row = {name: values[i] for name, values in columns.items()}
+            # Fill fields left out by a projected export
+            row.setdefault('title', '')
+            row.setdefault('dri', '')
+            row.setdefault('team_dri', '')
+            row.setdefault('status', '')
+            row['tags'] = row.get('tags') or []
+            row['comments_history'] = row.get('comments_history') or []
+            imported_data.append(row)
+
+        self.load_imported_data(imported_data)
+
+    async def import_data(self, e):
+        name = e.file.name.lower()
+        content = await e.file.read()
+        if name.endswith(COLUMNAR_EXTENSIONS):
+            self.import_columnar(name, content)
+            return
+
+        content = content.decode('utf-8')
         df = pd.read_csv(io.StringIO(content))
         imported_data = df.to_dict('records')
 
@@ -747,6 +1202,11 @@ class RadarTracker:
                 tags = row['tags'].split(', ')
                 row['tags'] = [{'text': tag, 'color': TAG_COLORS.get(tag, '#808080')}
                                for tag in tags]
+
+        self.load_imported_data(imported_data)
+
+    def load_imported_data(self, imported_data: List[Dict]):
+        for row in imported_data:
             # Initialize history if not present
             if 'history' not in row:
                 row['history'] = [{
@@ -758,16 +1218,191 @@ class RadarTracker:
 
         self.data = imported_data
         self.filtered_data = self.data.copy()
+        self.search_index.rebuild(self.data)
+        self.data_version += 1
         self.search_query = ""
         self.status_filter = None
         self.tag_filter = None
         self.update_table()
         ui.notify('Data imported successfully')
 
+    def memory_breakdown(self) -> Dict:
+        """Approximate bytes held per structure. Sizes are exclusive: objects shared with a
+        structure listed earlier (e.g. rows referenced by filtered_data) are counted only once."""
+        seen = set()
+        index = self.search_index
+        return {
+            'rows': len(self.data),
+            'store': deep_getsizeof(self.data, seen),
+            'filtered_data': deep_getsizeof(self.filtered_data, seen),
+            'table_rows': deep_getsizeof(self.table.rows, seen) if hasattr(self, 'table') else 0,
+            'search_index': deep_getsizeof(
+                [index.postings, index.doc_fields, index.doc_lengths, index.vocabulary], seen),
+            'result_cache': deep_getsizeof(self.result_cache.entries, seen),
+        }
+
+    def memory_counters(self) -> Dict:
+        """Cheap element counts of the same structures, for periodic sampling"""
+        cache_stats = self.result_cache.stats()
+        return {
+            'rows': len(self.data),
+            'filtered_rows': len(self.filtered_data),
+            'table_rows': len(self.table.rows) if hasattr(self, 'table') else 0,
+            'index_terms': len(self.search_index.vocabulary),
+            'index_docs': len(self.search_index.doc_lengths),
+            'cache_entries': cache_stats['entries'],
+            'cache_rows': cache_stats['rows'],
+        }
+
+
+def deep_getsizeof(obj, seen: Optional[set] = None) -> int:
+    """Size in bytes of obj plus everything reachable through builtin containers"""
+    if seen is None:
+        seen = set()
+    size = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        size += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset, deque)):
+            stack.extend(item)
+    return size
+
+
+def peak_rss_bytes() -> Optional[int]:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+async def memory_report(deep: bool = False) -> Dict:
+    """Per-client structure sizes and UI element counts for the whole process.
+    Runs on the event loop so tracker state can't change underneath it; deep=false skips
+    the byte-size traversal (which can take seconds on large stores) and reports counts only."""
+    clients = []
+    for client in list(Client.instances.values()):
+        elements = list(client.elements.values())
+        entry = {
+            'client_id': client.id,
+            'elements': len(elements),
+            'dialogs': sum(isinstance(element, ui.dialog) for element in elements),
+        }
+        tracker = getattr(client, 'radar_tracker', None)
+        if tracker is not None:
+            entry['counters'] = tracker.memory_counters()
+            if deep:
+                entry['structures'] = tracker.memory_breakdown()
+        clients.append(entry)
+
+    report = {
+        'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        'peak_rss_bytes': peak_rss_bytes(),
+        'clients': clients,
+        'totals': {
+            'clients': len(clients),
+            'elements': sum(c['elements'] for c in clients),
+        },
+    }
+    if deep:
+        report['gc_objects'] = len(gc.get_objects())
+        report['totals']['structure_bytes'] = sum(
+            sum(v for k, v in c.get('structures', {}).items() if k != 'rows') for c in clients)
+    if tracemalloc.is_tracing():
+        current, peak = tracemalloc.get_traced_memory()
+        report['tracemalloc'] = {'current_bytes': current, 'peak_bytes': peak}
+    return report
+
+
+_tracemalloc_state = {'previous': None}
+
+
+def take_tracemalloc_snapshot() -> tracemalloc.Snapshot:
+    return tracemalloc.take_snapshot().filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+    ])
+
+
+async def tracemalloc_start() -> Dict:
+    """Start tracing allocations for the whole process and record the baseline"""
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(TRACEMALLOC_FRAMES)
+    _tracemalloc_state['previous'] = take_tracemalloc_snapshot()
+    return {'status': 'started'}
+
+
+async def tracemalloc_stop() -> Dict:
+    tracemalloc.stop()
+    _tracemalloc_state['previous'] = None
+    return {'status': 'stopped'}
+
+
+async def tracemalloc_diff(top: int = 25) -> Dict:
+    """Allocation growth by source line since the previous call (or since tracing started)"""
+    if not tracemalloc.is_tracing():
+        return {'status': 'not tracing, POST /diagnostics/tracemalloc/start to begin'}
+    snapshot = take_tracemalloc_snapshot()
+    previous = _tracemalloc_state['previous']
+    _tracemalloc_state['previous'] = snapshot
+    if previous is None:
+        return {'status': 'baseline recorded, call again to diff'}
+
+    current, peak = tracemalloc.get_traced_memory()
+    return {
+        'status': 'ok',
+        'current_bytes': current,
+        'peak_bytes': peak,
+        'top': [{
+            'location': str(stat.traceback[0]),
+            'size_diff': stat.size_diff,
+            'size': stat.size,
+            'count_diff': stat.count_diff,
+            'count': stat.count,
+        } for stat in snapshot.compare_to(previous, 'lineno')[:top]],
+    }
+
+
+async def sample_memory_periodically():
+    while True:
+        await asyncio.sleep(MEMORY_SAMPLE_INTERVAL)
+        try:
+            report = await memory_report(deep=False)
+            with open(MEMORY_LOG, 'a') as f:
+                f.write(json.dumps(report) + '\n')
+        except Exception as e:
+            print(f'Memory sampling failed: {e}', file=sys.stderr)
+
+
+def require_loopback(request: Request):
+    if request.client is None or request.client.host not in LOOPBACK_HOSTS:
+        raise HTTPException(status_code=403, detail='Diagnostics are only available from localhost')
+
+
+def setup_diagnostics():
+    if app.is_started:
+        return  # the script is being re-executed for a new page (NiceGUI script mode)
+    if DIAGNOSTICS_ENABLED:
+        local_only = [Depends(require_loopback)]
+        app.get('/diagnostics/memory', dependencies=local_only)(memory_report)
+        app.get('/diagnostics/tracemalloc', dependencies=local_only)(tracemalloc_diff)
+        app.post('/diagnostics/tracemalloc/start', dependencies=local_only)(tracemalloc_start)
+        app.post('/diagnostics/tracemalloc/stop', dependencies=local_only)(tracemalloc_stop)
+    if MEMORY_SAMPLE_INTERVAL > 0:
+        app.on_startup(sample_memory_periodically)
+
 
 def main():
+    setup_diagnostics()
     RadarTracker()
-    ui.run()
+    ui.run(port=int(os.environ.get('RADAR_PORT', '8080')))
 
 
 if __name__ in {"__main__", "__mp_main__"}: